@@ -5,12 +5,22 @@ A tool to generate proper universe specifications for MCNP tallies and source de
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple, List, Union
+from typing import Dict, Optional, Tuple, List, Union
+from collections import defaultdict
+import itertools
+import io
+import sys
+import traceback
 import numpy as np
 import curses
 
 
-@dataclass
+# Accepted yes/no answers (lower-cased before matching)
+_YES_RESPONSES = frozenset(('y', 'yes'))
+_NO_RESPONSES = frozenset(('n', 'no'))
+
+
+@dataclass(slots=True)
 class LatticeSpec:
     """
     Represents lattice index specification (supports both contiguous and non-contiguous).
@@ -24,8 +34,34 @@ class LatticeSpec:
     j: Optional[Union[int, Tuple[int, int]]] = None
     k: Optional[Union[int, Tuple[int, int]]] = None
 
-    # For non-contiguous discrete elements (new functionality)
-    elements: Optional[List[Tuple[int, int, int]]] = None
+    # For non-contiguous discrete elements (new functionality).
+    # Accepts a list of (i,j,k) tuples; stored as an (N,3) integer ndarray
+    # (12 bytes/element instead of ~200 for boxed tuples of ints).
+    elements: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        # Normalize contiguous dimensions to (lo, hi) 2-tuples, with
+        # lo == hi for singletons, so downstream code handles one shape
+        # instead of isinstance-dispatching on int vs tuple
+        if isinstance(self.i, int):
+            self.i = (self.i, self.i)
+        if isinstance(self.j, int):
+            self.j = (self.j, self.j)
+        if isinstance(self.k, int):
+            self.k = (self.k, self.k)
+        if self.elements is not None:
+            arr = np.asarray(self.elements).reshape(-1, 3)
+            # int32 covers any realistic lattice; fall back to int64 for
+            # extreme indices in infinite lattices
+            info = np.iinfo(np.int32)
+            if arr.size and (arr.max() > info.max or arr.min() < info.min):
+                arr = arr.astype(np.int64)
+            else:
+                arr = arr.astype(np.int32)
+            # Canonicalize: drop duplicate elements (e.g. the same cell
+            # clicked twice in the selector) and sort lexicographically so
+            # generated SI cards are deterministic and diff cleanly
+            self.elements = np.unique(arr, axis=0)
 
     def is_contiguous(self) -> bool:
         """Check if this represents a contiguous range (vs discrete elements)"""
@@ -33,13 +69,12 @@ class LatticeSpec:
 
     def is_non_contiguous(self) -> bool:
         """Check if this represents discrete non-contiguous elements"""
-        return self.elements is not None
+        return self.elements is not None and self.elements.size > 0
 
-    def format_dimension(self, val: Union[int, Tuple[int, int]]) -> str:
-        """Format a single dimension as either 'n' or 'min:max'"""
-        if isinstance(val, tuple):
-            return f"{val[0]}:{val[1]}"
-        return str(val)
+    def format_dimension(self, val: Tuple[int, int]) -> str:
+        """Format a (lo, hi) dimension as either 'n' or 'min:max'"""
+        lo, hi = val
+        return str(lo) if lo == hi else f"{lo}:{hi}"
 
     def to_mcnp_string(self) -> str:
         """
@@ -54,7 +89,7 @@ class LatticeSpec:
             return f"[{i_str} {j_str} {k_str}]"
         else:
             # For non-contiguous, return representation of first element
-            if self.elements:
+            if len(self.elements):
                 i, j, k = self.elements[0]
                 return f"[{i} {j} {k}] (+{len(self.elements)-1} more)"
             return "[empty]"
@@ -63,32 +98,55 @@ class LatticeSpec:
         """Format a single (i,j,k) tuple as MCNP index"""
         return f"[{element[0]} {element[1]} {element[2]}]"
 
-    def get_all_elements(self) -> List[Tuple[int, int, int]]:
-        """Get list of all (i,j,k) tuples, whether contiguous or non-contiguous"""
+    def enumerate(self) -> np.ndarray:
+        """
+        Enumerate every discrete (i,j,k) element as an (N,3) int array.
+        Contiguous ranges are expanded with NumPy broadcasting instead of
+        a triple Python loop (thousands of elements for large ranges).
+        """
         if self.is_non_contiguous():
             return self.elements
-        else:
-            # For contiguous, return single element or None (will be handled differently)
-            return []
+
+        def axis(val):
+            return np.arange(val[0], val[1] + 1, dtype=np.int32)
+
+        ii, jj, kk = axis(self.i), axis(self.j), axis(self.k)
+        return np.stack(np.meshgrid(ii, jj, kk, indexing='ij'), axis=-1).reshape(-1, 3)
+
+    def get_all_elements(self) -> List[Tuple[int, int, int]]:
+        """Get list of all (i,j,k) tuples, whether contiguous or non-contiguous"""
+        return [tuple(row) for row in self.enumerate().tolist()]
+
+    def elements_array(self) -> Optional[np.ndarray]:
+        """Raw (N,3) element array for callers that iterate in bulk and
+        don't need boxed tuples."""
+        return self.elements
 
     def is_single_element(self) -> bool:
         """Check if this is a single element (no ranges, or one discrete element)"""
         if self.is_contiguous():
-            return all(isinstance(v, int) for v in [self.i, self.j, self.k])
+            return all(lo == hi for lo, hi in (self.i, self.j, self.k))
         else:
             return len(self.elements) == 1
 
     def element_count(self) -> int:
         """Return number of discrete lattice elements represented"""
         if self.is_non_contiguous():
-            return len(self.elements)
+            return self.elements.shape[0]
+        else:
+            # Size of the contiguous range
+            return ((self.i[1] - self.i[0] + 1)
+                    * (self.j[1] - self.j[0] + 1)
+                    * (self.k[1] - self.k[0] + 1))
+
+    def _key(self) -> tuple:
+        """Hashable representation for caching (fields may be mutated, so
+        dataclass __eq__/__hash__ can't be relied on)."""
+        if self.elements is not None:
+            elements = tuple(map(tuple, self.elements.tolist()))
         else:
-            # Calculate size of contiguous range
-            def get_size(val):
-                if isinstance(val, tuple):
-                    return val[1] - val[0] + 1
-                return 1
-            return get_size(self.i) * get_size(self.j) * get_size(self.k)
+            elements = None
+        return (self.i, self.j, self.k, elements)
 
     def __repr__(self):
         if self.is_contiguous():
@@ -97,7 +155,7 @@ class LatticeSpec:
             return f"NonContiguous[{len(self.elements)} elements]"
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """
     Represents a single cell in the universe stack path.
@@ -117,9 +175,16 @@ class Node:
     def lattice_index(self) -> Optional[Tuple[int, int, int]]:
         """Backward compatibility: return single index if lattice_spec is single element"""
         if self.lattice_spec and self.lattice_spec.is_single_element():
-            return (self.lattice_spec.i, self.lattice_spec.j, self.lattice_spec.k)
+            spec = self.lattice_spec
+            return (spec.i[0], spec.j[0], spec.k[0])
         return None
 
+    def _key(self) -> tuple:
+        """Hashable representation of this node for path caching."""
+        spec_key = self.lattice_spec._key() if self.lattice_spec else None
+        return (self.cell_id, self.universe_id, self.fill_id,
+                self.is_lattice, self.is_infinite_lattice, spec_key)
+
     def __repr__(self):
         lat_str = f" [LAT spec: {self.lattice_spec}]" if self.lattice_spec else ""
         fill_str = f" (fills U={self.fill_id})" if self.fill_id else ""
@@ -135,6 +200,17 @@ class MCNPWizard:
         self.universe_stack: List[Node] = []
         self.target_cell: Optional[int] = None
         self.target_volume: Optional[float] = None
+        self._path_cache: dict = {}  # Stack key -> built path string
+        self._nc_node_index: int = -1  # Index of non-contiguous lattice node
+        # Per-node kind codes, parallel to universe_stack:
+        # 0 = plain cell, 1 = lattice (contiguous), 2 = lattice (non-contiguous)
+        self._stack_kinds: Tuple[int, ...] = ()
+        self._out = io.StringIO()  # Pending output (see emit/flush_out)
+        # Per-level formatted path segments, parallel to universe_stack
+        self._segments: List[str] = []
+        self._segment_keys: list = []
+        # Lazily-filled line iterator for piped (non-tty) stdin; see _input()
+        self._stdin_lines = None
         
     def run(self):
         """Main entry point for the wizard."""
@@ -169,7 +245,7 @@ class MCNPWizard:
         print("  3. Both")
         
         while True:
-            choice = input("\nEnter choice (1/2/3): ").strip()
+            choice = self._input("\nEnter choice (1/2/3): ").strip()
             if choice == '1':
                 return 'tally'
             elif choice == '2':
@@ -204,15 +280,17 @@ class MCNPWizard:
             )
         else:
             current_node.universe_id = 0
-            self.universe_stack.append(current_node)
+            self.push_node(current_node)
             print(f"\n✓ Cell {self.target_cell} is in the global universe (U=0)")
             return
         
-        self.universe_stack.append(current_node)
+        self.push_node(current_node)
         
         # Now climb up the stack
         self._climb_universe_stack(current_node.universe_id)
         
+        self._refresh_stack_kinds()
+
         print("\n" + "=" * 70)
         print("Universe Stack Complete:")
         print("=" * 70)
@@ -354,7 +432,7 @@ class MCNPWizard:
         else:
             parent_node.universe_id = 0
             
-        self.universe_stack.append(parent_node)
+        self.push_node(parent_node)
         
         # Recurse if not at global level
         if parent_node.universe_id != 0:
@@ -362,33 +440,35 @@ class MCNPWizard:
     
     def _generate_tally_output(self):
         """Generate the tally specification string."""
-        print("\n" + "=" * 70)
-        print("TALLY SPECIFICATION")
-        print("=" * 70)
-        
+        self.emit("\n" + "=" * 70,
+                  "TALLY SPECIFICATION",
+                  "=" * 70)
+        self.flush_out()
+
         # Ask for tally type
-        tally_type = input("\nEnter tally type (e.g., F4:N, F7:N, F4:P): ").strip().upper()
+        tally_type = self._input("\nEnter tally type (e.g., F4:N, F7:N, F4:P): ").strip().upper()
         
         # Build the path string
         path_string = self._build_tally_path()
         
         # Generate tally card
         tally_card = f"{tally_type} {path_string}"
-        
-        print("\n" + "-" * 70)
-        print("GENERATED TALLY CARD:")
-        print("-" * 70)
-        print(tally_card)
-        print("-" * 70)
-        
+
+        self.emit("\n" + "-" * 70,
+                  "GENERATED TALLY CARD:",
+                  "-" * 70,
+                  tally_card,
+                  "-" * 70)
+
         # Check if SD card is needed
         needs_sd = self._check_needs_sd_card()
         
         if needs_sd:
-            print("\n⚠ WARNING: This tally requires a Segment Divisor (SD) card!")
-            print(f"   Target Cell {self.target_cell} is inside a lattice.")
-            print("   MCNP cannot auto-calculate volumes for lattice elements.")
-            print(f"   You must specify the volume of Cell {self.target_cell} in cm³.")
+            self.emit("\n⚠ WARNING: This tally requires a Segment Divisor (SD) card!",
+                      f"   Target Cell {self.target_cell} is inside a lattice.",
+                      "   MCNP cannot auto-calculate volumes for lattice elements.",
+                      f"   You must specify the volume of Cell {self.target_cell} in cm³.")
+            self.flush_out()
 
             provide_volume = self._get_yes_no(f"\nDo you know the volume of Cell {self.target_cell} (in cm³)?")
 
@@ -396,25 +476,26 @@ class MCNPWizard:
                 self.target_volume = self._get_float_input(f"Enter volume of Cell {self.target_cell} (cm³):")
                 tally_num = tally_type[1]  # Extract number from F4:N -> 4
                 sd_card = f"SD{tally_num} {self.target_volume}"
-                print("\n" + "-" * 70)
-                print("REQUIRED SD CARD:")
-                print("-" * 70)
-                print(sd_card)
-                print("-" * 70)
-                print(f"\nThis specifies that Cell {self.target_cell} has a volume of {self.target_volume} cm³")
-                print("in each lattice element where it appears.")
+                self.emit("\n" + "-" * 70,
+                          "REQUIRED SD CARD:",
+                          "-" * 70,
+                          sd_card,
+                          "-" * 70,
+                          f"\nThis specifies that Cell {self.target_cell} has a volume of {self.target_volume} cm³",
+                          "in each lattice element where it appears.")
             else:
-                print("\n⚠ You MUST add an SD card manually with the correct volume!")
-                print(f"   Format: SD{tally_type[1]} <volume_of_cell_{self.target_cell}_in_cm3>")
-                print(f"   Example: SD{tally_type[1]} 2.75  $ Volume of Cell {self.target_cell} in cm³")
+                self.emit("\n⚠ You MUST add an SD card manually with the correct volume!",
+                          f"   Format: SD{tally_type[1]} <volume_of_cell_{self.target_cell}_in_cm3>",
+                          f"   Example: SD{tally_type[1]} 2.75  $ Volume of Cell {self.target_cell} in cm³")
+        self.flush_out()
         
     def _generate_sdef_output(self):
         """Generate the SDEF specification using distribution method."""
-        print("\n" + "=" * 70)
-        print("SOURCE DEFINITION (SDEF) SPECIFICATION")
-        print("=" * 70)
-
-        print("\nUsing the robust Distribution method (SI/SP cards)...")
+        self.emit("\n" + "=" * 70,
+                  "SOURCE DEFINITION (SDEF) SPECIFICATION",
+                  "=" * 70,
+                  "\nUsing the robust Distribution method (SI/SP cards)...")
+        self.flush_out()
 
         # Ask for distribution number
         dist_num = self._get_int_input("\nEnter distribution number to use (e.g., 1 for d1):", default=1)
@@ -426,8 +507,9 @@ class MCNPWizard:
         include_pos = self._get_yes_no("\nDo you want to specify a position (POS)?")
 
         if include_pos:
-            print("\n⚠ NOTE: You must specify coordinates in the TARGET cell's local frame.")
-            print("   (Global coordinate transformation not yet implemented)")
+            self.emit("\n⚠ NOTE: You must specify coordinates in the TARGET cell's local frame.",
+                      "   (Global coordinate transformation not yet implemented)")
+            self.flush_out()
             x = self._get_float_input("  X coordinate:")
             y = self._get_float_input("  Y coordinate:")
             z = self._get_float_input("  Z coordinate:")
@@ -440,35 +522,48 @@ class MCNPWizard:
             sdef_card += f" ERG={erg}"
 
         # Generate SI/SP cards based on contiguity
-        if self._has_non_contiguous_lattice():
+        self._refresh_stack_kinds()
+        if self._nc_node_index >= 0:
             # NON-CONTIGUOUS: Use Method 3 (separate paths in SI list)
-            # Find the non-contiguous lattice node
-            non_contiguous_node = None
-            for node in self.universe_stack:
-                if node.is_lattice and node.lattice_spec and node.lattice_spec.is_non_contiguous():
-                    non_contiguous_node = node
-                    break
-
-            elements = non_contiguous_node.lattice_spec.get_all_elements()
+            non_contiguous_node = self.universe_stack[self._nc_node_index]
+
+            elements = non_contiguous_node.lattice_spec.elements_array()
             num_elements = len(elements)
 
-            # Build separate paths for each element
-            paths = []
-            for element in elements:
-                single_path = self._build_single_path(lattice_element=element)
-                paths.append(f"({single_path})")
+            # Build separate paths for each element. With one substitution
+            # slot everything else is loop-invariant, so join the constant
+            # prefix/suffix once and bulk-format the index triples - for a
+            # visual-selector pick of thousands of elements the per-element
+            # work is a single f-string. With several non-contiguous levels
+            # each one receives the element, so fill a template copy per
+            # element instead.
+            tmpl, nc_slots = self._build_path_template()
+            if len(nc_slots) == 1:
+                slot = nc_slots[0]
+                nc_cell = self.universe_stack[slot].cell_id
+                before = " < ".join(tmpl[:slot])
+                after = " < ".join(tmpl[slot + 1:])
+                prefix = f"({before} < {nc_cell}[" if before else f"({nc_cell}["
+                suffix = f"] < {after})" if after else "])"
+                paths = [f"{prefix}{i} {j} {k}{suffix}" for i, j, k in elements.tolist()]
+            else:
+                cells = [(idx, self.universe_stack[idx].cell_id) for idx in nc_slots]
+                paths = []
+                for i, j, k in elements.tolist():
+                    parts = tmpl.copy()
+                    for idx, cell_id in cells:
+                        parts[idx] = f"{cell_id}[{i} {j} {k}]"
+                    paths.append("(" + " < ".join(parts) + ")")
 
-            # SI card with list of paths
-            si_card = f"SI{dist_num} L"
-            for path in paths:
-                si_card += f" {path}"
+            # SI card with list of paths - single join instead of quadratic +=
+            si_card = " ".join([f"SI{dist_num} L"] + paths)
 
             # SP card with equal probabilities
             sp_values = " ".join(["1"] * num_elements)
             sp_card = f"SP{dist_num} {sp_values}"
 
-            print(f"\n⚠ NON-CONTIGUOUS selection detected!")
-            print(f"   Generating {num_elements} separate source locations with equal probability.")
+            self.emit(f"\n⚠ NON-CONTIGUOUS selection detected!",
+                      f"   Generating {num_elements} separate source locations with equal probability.")
 
         else:
             # CONTIGUOUS: Use simple distribution (original behavior)
@@ -476,25 +571,85 @@ class MCNPWizard:
             si_card = f"SI{dist_num} L {path_string}"
             sp_card = f"SP{dist_num} 1"
 
-        print("\n" + "-" * 70)
-        print("GENERATED SOURCE DEFINITION:")
-        print("-" * 70)
-        print(sdef_card)
-        print(si_card)
-        print(sp_card)
-        print("-" * 70)
+        self.emit("\n" + "-" * 70,
+                  "GENERATED SOURCE DEFINITION:",
+                  "-" * 70,
+                  sdef_card,
+                  si_card,
+                  sp_card,
+                  "-" * 70)
+        self.flush_out()
         
     def _generate_both_outputs(self):
         """Generate both tally and SDEF specifications."""
         self._generate_tally_output()
         self._generate_sdef_output()
 
+    def push_node(self, node: Node):
+        """Append a node to the universe stack, extending the segment cache
+        in O(1) instead of reformatting every level on the next path build."""
+        self.universe_stack.append(node)
+        self._segments.append(self._format_segment(len(self.universe_stack) - 1, node))
+        self._segment_keys.append(node._key())
+
+    def pop_node(self) -> Node:
+        """Remove and return the outermost node, truncating the segment cache."""
+        self._segments.pop()
+        self._segment_keys.pop()
+        return self.universe_stack.pop()
+
+    def _format_segment(self, idx: int, node: Node) -> str:
+        """Format one stack level as it appears in a path string."""
+        if idx > 0 and node.is_lattice and node.lattice_spec and node.lattice_spec.is_contiguous():
+            return f"{node.cell_id}{node.lattice_spec.to_mcnp_string()}"
+        # Plain cell, or non-contiguous lattice (element substituted per path)
+        return str(node.cell_id)
+
+    def _stack_segments(self) -> List[str]:
+        """Return per-level path segments, refreshing the cache incrementally.
+
+        Client code may assign universe_stack directly rather than going
+        through push_node/pop_node, so validate level-by-level against the
+        node keys and reformat only levels that actually changed.
+        """
+        stack = self.universe_stack
+        segments, keys = self._segments, self._segment_keys
+        del segments[len(stack):], keys[len(stack):]
+        for idx, node in enumerate(stack):
+            key = node._key()
+            if idx < len(segments):
+                if keys[idx] != key:
+                    segments[idx] = self._format_segment(idx, node)
+                    keys[idx] = key
+            else:
+                segments.append(self._format_segment(idx, node))
+                keys.append(key)
+        return segments
+
     def _has_non_contiguous_lattice(self) -> bool:
         """Check if any lattice in the universe stack is non-contiguous"""
-        for node in self.universe_stack:
-            if node.is_lattice and node.lattice_spec and node.lattice_spec.is_non_contiguous():
-                return True
-        return False
+        return self._nc_node_index >= 0
+
+    def _refresh_stack_kinds(self):
+        """
+        Recompute the per-node kind codes (_stack_kinds) and the
+        non-contiguous node index (_nc_node_index) in one pass. Called
+        once per generation pass; every other consumer reads the caches
+        instead of re-testing is_lattice/lattice_spec per node.
+        """
+        kinds = []
+        nc_index = -1
+        for idx, node in enumerate(self.universe_stack):
+            if not node.is_lattice:
+                kinds.append(0)
+            elif node.lattice_spec and node.lattice_spec.is_non_contiguous():
+                kinds.append(2)
+                if nc_index < 0:
+                    nc_index = idx
+            else:
+                kinds.append(1)
+        self._stack_kinds = tuple(kinds)
+        self._nc_node_index = nc_index
 
     def _build_single_path(self, lattice_element: Optional[Tuple[int, int, int]] = None) -> str:
         """
@@ -506,48 +661,72 @@ class MCNPWizard:
         Returns:
             Path string like "target < parent[i j k] < global"
         """
-        parts = [str(self.universe_stack[0].cell_id)]
-
-        for node in self.universe_stack[1:]:
-            if node.is_lattice and node.lattice_spec:
-                if node.lattice_spec.is_non_contiguous() and lattice_element is not None:
-                    # Use specific element for this node
-                    parts.append(f"{node.cell_id}{node.lattice_spec.to_mcnp_single_index(lattice_element)}")
-                elif node.lattice_spec.is_contiguous():
-                    # Use range syntax
-                    parts.append(f"{node.cell_id}{node.lattice_spec.to_mcnp_string()}")
-                else:
-                    # Non-contiguous but no element specified - shouldn't happen
-                    parts.append(f"{node.cell_id}")
-            else:
-                parts.append(str(node.cell_id))
+        parts = self._stack_segments()
+
+        if lattice_element is not None:
+            # Substitute the specific element into every non-contiguous
+            # slot above the target level
+            parts = list(parts)
+            for idx in self._nc_slot_indices():
+                node = self.universe_stack[idx]
+                parts[idx] = (
+                    f"{node.cell_id}{node.lattice_spec.to_mcnp_single_index(lattice_element)}")
 
         return " < ".join(parts)
 
+    def _nc_slot_indices(self) -> List[int]:
+        """
+        Indices of the non-contiguous lattice levels that take a
+        per-element index substitution (level 0 is the target cell and is
+        always emitted as a bare cell id).
+        """
+        return [idx for idx, kind in enumerate(self._stack_kinds)
+                if kind == 2 and idx > 0]
+
+    def _build_path_template(self) -> Tuple[List[str], List[int]]:
+        """
+        Return (parts, nc_slots): the per-level segment list plus the slot
+        indices of the non-contiguous lattice nodes (empty if none).
+        Per-element loops can then do a list.copy plus one assignment per
+        slot instead of re-validating the segment cache for every element.
+        """
+        return list(self._stack_segments()), self._nc_slot_indices()
+
     def _build_union_paths(self) -> str:
         """
         Build union of paths for non-contiguous lattice selections.
         Uses MCNP Method 2: ( (path1) (path2) ... (pathN) )
         """
-        # Find the non-contiguous lattice node
-        non_contiguous_node = None
-        for node in self.universe_stack:
-            if node.is_lattice and node.lattice_spec and node.lattice_spec.is_non_contiguous():
-                non_contiguous_node = node
-                break
-
-        if not non_contiguous_node:
+        if self._nc_node_index < 0:
             # Shouldn't happen, but fall back to regular path
             return self._build_single_path()
 
-        # Get all elements from the non-contiguous lattice
-        elements = non_contiguous_node.lattice_spec.get_all_elements()
-
-        # Build a separate path for each element
-        paths = []
-        for element in elements:
-            single_path = self._build_single_path(lattice_element=element)
-            paths.append(f"( {single_path} )")
+        non_contiguous_node = self.universe_stack[self._nc_node_index]
+        elements = non_contiguous_node.lattice_spec.elements_array()
+        tmpl = list(self._stack_segments())
+        nc_slots = self._nc_slot_indices()
+
+        if len(nc_slots) == 1:
+            # Common case: one substitution slot. Everything around the
+            # lattice index is the same for every element, so join the
+            # constant prefix/suffix once and only format the "i j k"
+            # triple in the per-element loop - for thousands of selected
+            # elements this avoids re-walking the whole stack per path.
+            slot = nc_slots[0]
+            prefix = "( " + " < ".join(tmpl[:slot]) + f" < {self.universe_stack[slot].cell_id}["
+            suffix = "]" + (" < " + " < ".join(tmpl[slot + 1:]) if slot + 1 < len(tmpl) else "") + " )"
+            paths = [f"{prefix}{i} {j} {k}{suffix}" for i, j, k in elements.tolist()]
+        else:
+            # Multiple non-contiguous levels: each one receives the
+            # iterated element (matching _build_single_path), so fill a
+            # template copy per element
+            cells = [(idx, self.universe_stack[idx].cell_id) for idx in nc_slots]
+            paths = []
+            for i, j, k in elements.tolist():
+                parts = tmpl.copy()
+                for idx, cell_id in cells:
+                    parts[idx] = f"{cell_id}[{i} {j} {k}]"
+                paths.append("( " + " < ".join(parts) + " )")
 
         # Join with spaces (union syntax)
         union = " ".join(paths)
@@ -567,22 +746,33 @@ class MCNPWizard:
         if not self.universe_stack:
             return f"( {self.target_cell} )"
 
-        # Check if we have any non-contiguous lattices
-        if self._has_non_contiguous_lattice():
-            return self._build_union_paths()
+        # Memoize on the stack contents - repeated builds of the same stack
+        # (common when generating both tally and SDEF output) are O(1)
+        key = tuple(n._key() for n in self.universe_stack) + (self.target_cell,)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Locate any non-contiguous lattice once for this build; the union
+        # and single-path builders reuse the cached index
+        self._refresh_stack_kinds()
+        if self._nc_node_index >= 0:
+            result = self._build_union_paths()
+        else:
+            # Contiguous case (original behavior)
+            result = f"( {self._build_single_path()} )"
 
-        # Contiguous case (original behavior)
-        path = self._build_single_path()
-        return f"( {path} )"
+        self._path_cache[key] = result
+        return result
     
     def _check_needs_sd_card(self) -> bool:
         """Check if this specification needs an SD card."""
-        # SD card needed if target is inside a lattice
-        if len(self.universe_stack) > 1:
-            for node in self.universe_stack[1:]:
-                if node.is_lattice:
-                    return True
-        return False
+        # Refresh rather than trust call order: a warm path cache skips
+        # the refresh in _build_tally_path, and the pass is O(depth)
+        self._refresh_stack_kinds()
+        # SD card needed if target is inside a lattice (any non-zero kind
+        # above the target level)
+        return any(self._stack_kinds[1:])
     
     def _offer_verification(self):
         """Offer to generate verification input."""
@@ -602,43 +792,40 @@ class MCNPWizard:
     
     def _generate_verification_deck(self):
         """Generate a verification deck snippet."""
-        print("\n" + "-" * 70)
-        print("VERIFICATION DECK SNIPPET")
-        print("-" * 70)
-        print("C --- Paste this into an MCNP input for verification ---")
-        print("C --- Run with 50 particles and check PRINT 110 output ---")
-        print()
-        
         path_string = self._build_tally_path()
-        
-        print(f"SDEF CEL=d1 ERG=1.0")
-        print(f"SI1 L {path_string}")
-        print(f"SP1 1")
-        print(f"C")
-        print(f"NPS 50")
-        print(f"PRINT 110")
-        print(f"C")
-        print(f"C Set all materials to VOID for testing:")
-        print(f"C M0   $ Void")
-        print()
-        print("-" * 70)
-        print("\n✓ Instructions:")
-        print("  1. Add this to a copy of your input deck")
-        print("  2. Set all materials to void (M0 or remove material cards)")
-        print("  3. Run MCNP")
-        print("  4. Check output file for 'source particle' lines")
-        print("  5. Verify particles start in the correct cell/lattice position")
-        print("  6. If particles are 'lost' or in Cell 0, check your specification")
+
+        self.emit("\n" + "-" * 70,
+                  "VERIFICATION DECK SNIPPET",
+                  "-" * 70,
+                  "C --- Paste this into an MCNP input for verification ---",
+                  "C --- Run with 50 particles and check PRINT 110 output ---",
+                  "",
+                  f"SDEF CEL=d1 ERG=1.0",
+                  f"SI1 L {path_string}",
+                  f"SP1 1",
+                  f"C",
+                  f"NPS 50",
+                  f"PRINT 110",
+                  f"C",
+                  f"C Set all materials to VOID for testing:",
+                  f"C M0   $ Void",
+                  "",
+                  "-" * 70,
+                  "\n✓ Instructions:",
+                  "  1. Add this to a copy of your input deck",
+                  "  2. Set all materials to void (M0 or remove material cards)",
+                  "  3. Run MCNP",
+                  "  4. Check output file for 'source particle' lines",
+                  "  5. Verify particles start in the correct cell/lattice position",
+                  "  6. If particles are 'lost' or in Cell 0, check your specification")
+        self.flush_out()
 
     def _validate_visual_selector_size(self, bounds: Tuple[Tuple[int,int], Tuple[int,int], Tuple[int,int]]) -> bool:
         """
         Check if visual selector can handle this size.
         Warns if grid is too large for comfortable terminal display.
         """
-        i_range, j_range, k_range = bounds
-        i_size = i_range[1] - i_range[0] + 1
-        j_size = j_range[1] - j_range[0] + 1
-        k_size = k_range[1] - k_range[0] + 1
+        i_size, j_size, k_size = VisualLatticeSelector._bounds_sizes(bounds)
 
         cells_per_layer = i_size * j_size
         total_cells = cells_per_layer * k_size
@@ -665,7 +852,7 @@ class MCNPWizard:
         if is_infinite:
             print("(Viewing window mode - lattice is actually infinite)")
         print("(Terminal will switch to interactive mode)")
-        input("Press Enter to continue...")
+        self._input("Press Enter to continue...")
 
         try:
             selector = VisualLatticeSelector(lattice_type, bounds, is_infinite=is_infinite)
@@ -692,7 +879,7 @@ class MCNPWizard:
         def parse_dimension(prompt: str) -> Union[int, Tuple[int, int]]:
             """Parse a single dimension (can be single value or range)."""
             while True:
-                response = input(prompt).strip()
+                response = self._input(prompt).strip()
                 if ':' in response:
                     # Range format
                     try:
@@ -723,38 +910,79 @@ class MCNPWizard:
 
         return LatticeSpec(i=i_spec, j=j_spec, k=k_spec)
 
+    # Output buffering: contiguous print blocks are queued with emit() and
+    # written with a single stdout write, so each screenful costs one
+    # write() instead of one per line.
+    def emit(self, *lines: str):
+        """Queue output lines to be written by the next flush_out()."""
+        out = self._out
+        for line in lines:
+            out.write(f"{line}\n")
+
+    def flush_out(self):
+        """Write all queued output as a single stdout write."""
+        text = self._out.getvalue()
+        if text:
+            sys.stdout.write(text)
+            self._out = io.StringIO()
+
     # Helper input methods
+    def _input(self, prompt: str) -> str:
+        """Read one line of user input, showing the prompt.
+
+        Interactive (tty) sessions write the prompt and read a line from
+        stdin directly, skipping input()'s readline machinery. Piped/
+        scripted sessions slurp stdin once and replay it line by line, so
+        each prompt costs a next() instead of a blocking read.
+        """
+        if sys.stdin.isatty():
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError("EOF when reading a line")
+            return line.rstrip("\n")
+        if self._stdin_lines is None:
+            self._stdin_lines = iter(sys.stdin.read().splitlines())
+        sys.stdout.write(prompt)
+        try:
+            return next(self._stdin_lines)
+        except StopIteration:
+            raise EOFError("EOF when reading a line") from None
+
     def _get_int_input(self, prompt: str, default: Optional[int] = None) -> int:
         """Get integer input from user with validation."""
+        if default is not None:
+            formatted = f"{prompt} [default: {default}]: "
+        else:
+            formatted = f"{prompt}: "
         while True:
             try:
-                if default is not None:
-                    response = input(f"{prompt} [default: {default}]: ").strip()
-                    if not response:
-                        return default
-                else:
-                    response = input(f"{prompt}: ").strip()
-                
+                response = self._input(formatted).strip()
+                if not response and default is not None:
+                    return default
                 return int(response)
             except ValueError:
                 print("Invalid input. Please enter an integer.")
     
     def _get_float_input(self, prompt: str) -> float:
         """Get float input from user with validation."""
+        formatted = f"{prompt}: "
         while True:
             try:
-                response = input(f"{prompt}: ").strip()
+                response = self._input(formatted).strip()
                 return float(response)
             except ValueError:
                 print("Invalid input. Please enter a number.")
     
     def _get_yes_no(self, prompt: str) -> bool:
         """Get yes/no input from user."""
+        formatted = f"{prompt} (y/n): "
         while True:
-            response = input(f"{prompt} (y/n): ").strip().lower()
-            if response in ('y', 'yes'):
+            response = self._input(formatted).strip().lower()
+            if response in _YES_RESPONSES:
                 return True
-            elif response in ('n', 'no'):
+            elif response in _NO_RESPONSES:
                 return False
             else:
                 print("Invalid input. Please enter 'y' or 'n'.")
@@ -780,7 +1008,87 @@ class VisualLatticeSelector:
         self.current_k = (self.k_bounds[0] + self.k_bounds[1]) // 2  # Start at middle k-layer
         self.cursor_i = (self.i_bounds[0] + self.i_bounds[1]) // 2
         self.cursor_j = (self.j_bounds[0] + self.j_bounds[1]) // 2
-        self.selected = set()  # Set of (i, j, k) tuples
+        # Selection stored per k-layer: k -> {(i, j)}. The draw loops
+        # only ever query the current layer, so membership tests avoid
+        # allocating a 3-tuple per visible cell.
+        self._selected_by_k: Dict[int, set] = defaultdict(set)
+
+        ni, nj, _ = self._bounds_sizes(bounds)
+        # Diff-rendering back-buffers: state code of every visible cell on
+        # the current k-layer. Only cells whose state changed since the
+        # previous frame are redrawn (255 = never drawn).
+        self._curr = np.zeros((ni, nj), dtype=np.uint8)
+        self._prev = np.full((ni, nj), 255, dtype=np.uint8)
+        self._static_drawn = False  # Title/headers/borders drawn once
+        self._result: Optional[LatticeSpec] = None  # Set by _handle_key
+        self._dirty = True  # Redraw needed (state changed since last frame)
+
+        # Per-state (glyph, attribute) tables, indexed by the _ST_* codes.
+        # Built once here so the draw loops do a single lookup per cell
+        # instead of recomputing attribute bitfields every frame.
+        self._rect_styles = (("·", curses.A_NORMAL),
+                             ("█", curses.A_BOLD),
+                             ("░", curses.A_REVERSE),
+                             ("█", curses.A_REVERSE | curses.A_BOLD))
+        self._hex_styles = (("·", curses.A_NORMAL),
+                            ("X", curses.A_BOLD),
+                            ("█", curses.A_REVERSE),
+                            ("@", curses.A_REVERSE | curses.A_BOLD))
+
+        # Keypress -> movement dispatch, built once so each keypress is a
+        # dict lookup instead of an elif chain. Hex keys map to compass
+        # directions for _try_move; rectangular arrows map to clamped
+        # (di, dj) steps.
+        self._hex_key_map = {
+            curses.KEY_UP: 'NW', curses.KEY_DOWN: 'SE',
+            curses.KEY_LEFT: 'W', curses.KEY_RIGHT: 'E',
+            ord('e'): 'NE', ord('w'): 'NW',
+            ord('x'): 'SE', ord('z'): 'SW',
+        }
+        self._rect_key_map = {
+            curses.KEY_UP: (0, -1), curses.KEY_DOWN: (0, 1),
+            curses.KEY_LEFT: (-1, 0), curses.KEY_RIGHT: (1, 0),
+        }
+
+        # Rectangular lattices render into a full-size pad; only the
+        # window around the cursor is blitted to the terminal, so lattices
+        # larger than the screen scroll instead of failing to draw.
+        # Created lazily on first draw (needs curses initialized).
+        self._pad = None
+        self._pad_h = nj + 4  # Header + top border + rows + bottom border (+ slack)
+        self._pad_w = ni * 4 + 6  # Row labels + cells + right border (+ slack)
+        self._pad_origin = (0, 0)  # Screen position of the blit (set on draw)
+        self._view = [0, 0]  # Top-left pad cell currently in view
+
+        # Static chrome depends only on the (fixed) bounds; format it once
+        # instead of per frame
+        i0, i1 = self.i_bounds
+        j0, j1 = self.j_bounds
+        border_width = ni * 4 + 1
+        self._rect_col_header = "    " + "".join([f"{i:4d}" for i in range(i0, i1 + 1)])
+        self._rect_border_top = "┌" + "─" * (border_width - 2) + "┐"
+        self._rect_border_bottom = "└" + "─" * (border_width - 2) + "┘"
+        self._rect_row_labels = [f"{j:3d} " for j in range(j0, j1 + 1)]
+        self._hex_col_header = "   " + "".join([f" {i:2} " for i in range(i0, i1 + 1)])
+        self._hex_row_labels = [f"{j:2} " for j in range(j0, j1 + 1)]
+
+    @staticmethod
+    def _bounds_sizes(bounds: Tuple[Tuple[int,int], Tuple[int,int], Tuple[int,int]]) -> Tuple[int, int, int]:
+        """Return (i_size, j_size, k_size) for inclusive bounds."""
+        (i_min, i_max), (j_min, j_max), (k_min, k_max) = bounds
+        return (i_max - i_min + 1, j_max - j_min + 1, k_max - k_min + 1)
+
+    # (direction, j & 1) -> (di, dj) for the offset coordinate system
+    # (odd rows shifted right). Callers only pass valid directions, so a
+    # bad key raising KeyError is a programming error, not user input.
+    _HEX_OFFSETS: Dict[Tuple[str, int], Tuple[int, int]] = {
+        ('E', 0): (1, 0),   ('E', 1): (1, 0),
+        ('W', 0): (-1, 0),  ('W', 1): (-1, 0),
+        ('NE', 0): (0, -1), ('NE', 1): (1, -1),
+        ('NW', 0): (-1, -1), ('NW', 1): (0, -1),
+        ('SE', 0): (0, 1),  ('SE', 1): (1, 1),
+        ('SW', 0): (-1, 1), ('SW', 1): (0, 1),
+    }
 
     def _get_hex_neighbor(self, i, j, direction):
         """
@@ -794,146 +1102,180 @@ class VisualLatticeSelector:
         Returns:
             (new_i, new_j) tuple
         """
-        is_odd_row = (j % 2 == 1)
-
-        if direction == 'E':
-            return (i + 1, j)
-        elif direction == 'W':
-            return (i - 1, j)
-        elif direction == 'NE':
-            if is_odd_row:
-                return (i + 1, j - 1)
-            else:
-                return (i, j - 1)
-        elif direction == 'NW':
-            if is_odd_row:
-                return (i, j - 1)
-            else:
-                return (i - 1, j - 1)
-        elif direction == 'SE':
-            if is_odd_row:
-                return (i + 1, j + 1)
-            else:
-                return (i, j + 1)
-        elif direction == 'SW':
-            if is_odd_row:
-                return (i, j + 1)
-            else:
-                return (i - 1, j + 1)
-        else:
-            return (i, j)
+        di, dj = self._HEX_OFFSETS[(direction, j & 1)]
+        return (i + di, j + dj)
+
+    def _try_move(self, direction: str):
+        """Move the cursor to its hex neighbor in direction, if that
+        neighbor is within the lattice bounds."""
+        new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, direction)
+        if (self.i_bounds[0] <= new_i <= self.i_bounds[1]
+                and self.j_bounds[0] <= new_j <= self.j_bounds[1]):
+            self.cursor_i, self.cursor_j = new_i, new_j
+            self._dirty = True
+
+    # Cell state codes used by the diff back-buffers and style tables.
+    # Laid out as a 2-bit field so state = 2*is_cursor + is_selected
+    _ST_EMPTY = 0
+    _ST_SELECTED = 1
+    _ST_CURSOR = 2
+    _ST_CURSOR_SEL = 3
+
+    def _force_repaint(self):
+        """Invalidate the static chrome and diff buffer for a full redraw."""
+        self._static_drawn = False
+        self._prev.fill(255)
+
+    @property
+    def selected(self) -> set:
+        """Flat {(i, j, k)} view of the per-layer selection."""
+        return {(i, j, k)
+                for k, layer in self._selected_by_k.items()
+                for (i, j) in layer}
+
+    def _selection_count(self) -> int:
+        """Number of selected cells across all k-layers."""
+        return sum(len(layer) for layer in self._selected_by_k.values())
+
+    def _cell_states(self) -> np.ndarray:
+        """Compute the state code of every visible cell for this frame."""
+        curr = self._curr
+        curr.fill(self._ST_EMPTY)
+        i0, j0 = self.i_bounds[0], self.j_bounds[0]
+        i1, j1 = self.i_bounds[1], self.j_bounds[1]
+        layer = self._selected_by_k.get(self.current_k)
+        if layer:
+            for (i, j) in layer:
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    curr[i - i0, j - j0] = self._ST_SELECTED
+        ci, cj = self.cursor_i - i0, self.cursor_j - j0
+        if 0 <= ci < curr.shape[0] and 0 <= cj < curr.shape[1]:
+            curr[ci, cj] += self._ST_CURSOR  # EMPTY->CURSOR, SELECTED->CURSOR_SEL
+        return curr
 
     def run(self, stdscr) -> Optional[LatticeSpec]:
         """Main curses loop for lattice selection."""
         curses.curs_set(0)  # Hide cursor
-        stdscr.clear()
+        stdscr.erase()
 
         while True:
-            stdscr.clear()
-            self._draw_interface(stdscr)
-            stdscr.refresh()
-
+            # Redraw only when a key actually changed cursor/selection/
+            # k-layer state; no-op keys cost nothing
+            if self._dirty:
+                self._draw_interface(stdscr)
+                stdscr.refresh()
+                # The rectangular lattice lives in a pad; blit its visible
+                # window last so it overlays the (blank) stdscr region
+                self._blit_pad(stdscr)
+                self._dirty = False
+
+            # Block for one key, then drain anything already queued (e.g.
+            # an autorepeat burst from a held arrow or ]/[ k-layer key) so
+            # N pending keystrokes cost a single redraw instead of N;
+            # intermediate k-layers in a burst are never rendered
             key = stdscr.getch()
+            while key != -1:
+                done = self._handle_key(stdscr, key)
+                if done:
+                    return self._result
+                stdscr.nodelay(True)
+                key = stdscr.getch()
+                stdscr.nodelay(False)
+
+    def _handle_key(self, stdscr, key) -> bool:
+        """Apply one key event. Returns True when the selector should
+        exit; the spec (or None for cancel) is left in self._result."""
+        if key == curses.KEY_RESIZE:
+            # Terminal resized: repaint everything once
+            stdscr.erase()
+            self._force_repaint()
+            self._dirty = True
+        elif key == ord('q') or key == 27:  # q or ESC
+            self._result = None
+            return True
+        elif key == ord('\n') or key == ord(' '):  # Enter or Space to toggle
+            cell = (self.cursor_i, self.cursor_j)
+            layer = self._selected_by_k[self.current_k]
+            if cell in layer:
+                layer.remove(cell)
+            else:
+                layer.add(cell)
+            self._dirty = True
+        elif key == ord('d'):  # Done
+            if any(self._selected_by_k.values()):
+                self._result = self._create_lattice_spec()
+                return True
+            else:
+                stdscr.addstr(0, 0, "ERROR: No cells selected! Press any key...", curses.A_REVERSE)
+                stdscr.refresh()
+                stdscr.getch()
+                stdscr.erase()
+                self._force_repaint()
+                self._dirty = True
+        elif self.lattice_type == 2 and key in self._hex_key_map:
+            # Hex navigation: arrows plus e/w/x/z diagonals
+            self._try_move(self._hex_key_map[key])
+        elif key in self._rect_key_map:
+            # Rectangular navigation: arrows, clamped to bounds
+            di, dj = self._rect_key_map[key]
+            new_i = min(self.i_bounds[1], max(self.i_bounds[0], self.cursor_i + di))
+            new_j = min(self.j_bounds[1], max(self.j_bounds[0], self.cursor_j + dj))
+            if (new_i, new_j) != (self.cursor_i, self.cursor_j):
+                self.cursor_i, self.cursor_j = new_i, new_j
+                self._dirty = True
+        elif key == ord('[') or key == ord(',') or key == ord('<'):  # Decrease k layer
+            new_k = max(self.k_bounds[0], self.current_k - 1)
+            if new_k != self.current_k:
+                self.current_k = new_k
+                self._dirty = True
+        elif key == ord(']') or key == ord('.') or key == ord('>'):  # Increase k layer
+            new_k = min(self.k_bounds[1], self.current_k + 1)
+            if new_k != self.current_k:
+                self.current_k = new_k
+                self._dirty = True
+        elif key == ord('a'):  # Select all
+            all_cells = list(itertools.product(
+                range(self.i_bounds[0], self.i_bounds[1] + 1),
+                range(self.j_bounds[0], self.j_bounds[1] + 1)))
+            for k in range(self.k_bounds[0], self.k_bounds[1] + 1):
+                self._selected_by_k[k].update(all_cells)
+            self._dirty = True
+        elif key == ord('c') and self.lattice_type != 2:  # Clear all (not hex, 'c' is used for diagonal)
+            self._selected_by_k.clear()
+            self._dirty = True
+        elif key == ord('r'):  # Reset/clear all (works for both rectangular and hex)
+            self._selected_by_k.clear()
+            self._dirty = True
 
-            if key == ord('q') or key == 27:  # q or ESC
-                return None
-            elif key == ord('\n') or key == ord(' '):  # Enter or Space to toggle
-                cell = (self.cursor_i, self.cursor_j, self.current_k)
-                if cell in self.selected:
-                    self.selected.remove(cell)
-                else:
-                    self.selected.add(cell)
-            elif key == ord('d'):  # Done
-                if self.selected:
-                    return self._create_lattice_spec()
-                else:
-                    stdscr.addstr(0, 0, "ERROR: No cells selected! Press any key...", curses.A_REVERSE)
-                    stdscr.refresh()
-                    stdscr.getch()
-            elif key == curses.KEY_UP:
-                if self.lattice_type == 2:  # Hexagonal - move NW
-                    new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'NW')
-                    if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                        self.cursor_i, self.cursor_j = new_i, new_j
-                else:  # Rectangular
-                    self.cursor_j = max(self.j_bounds[0], self.cursor_j - 1)
-            elif key == curses.KEY_DOWN:
-                if self.lattice_type == 2:  # Hexagonal - move SE
-                    new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'SE')
-                    if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                        self.cursor_i, self.cursor_j = new_i, new_j
-                else:  # Rectangular
-                    self.cursor_j = min(self.j_bounds[1], self.cursor_j + 1)
-            elif key == curses.KEY_LEFT:
-                if self.lattice_type == 2:  # Hexagonal - move W
-                    new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'W')
-                    if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                        self.cursor_i, self.cursor_j = new_i, new_j
-                else:  # Rectangular
-                    self.cursor_i = max(self.i_bounds[0], self.cursor_i - 1)
-            elif key == curses.KEY_RIGHT:
-                if self.lattice_type == 2:  # Hexagonal - move E
-                    new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'E')
-                    if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                        self.cursor_i, self.cursor_j = new_i, new_j
-                else:  # Rectangular
-                    self.cursor_i = min(self.i_bounds[1], self.cursor_i + 1)
-            # Additional hex navigation keys (Q/E for NE/NW diagonals, Z/X for SW/SE diagonals)
-            elif key == ord('e') and self.lattice_type == 2:  # NE diagonal
-                new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'NE')
-                if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                    self.cursor_i, self.cursor_j = new_i, new_j
-            elif key == ord('w') and self.lattice_type == 2:  # NW diagonal (duplicate of UP, but explicit)
-                new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'NW')
-                if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                    self.cursor_i, self.cursor_j = new_i, new_j
-            elif key == ord('x') and self.lattice_type == 2:  # SE diagonal (duplicate of DOWN, but explicit)
-                new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'SE')
-                if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                    self.cursor_i, self.cursor_j = new_i, new_j
-            elif key == ord('z') and self.lattice_type == 2:  # SW diagonal
-                new_i, new_j = self._get_hex_neighbor(self.cursor_i, self.cursor_j, 'SW')
-                if self.i_bounds[0] <= new_i <= self.i_bounds[1] and self.j_bounds[0] <= new_j <= self.j_bounds[1]:
-                    self.cursor_i, self.cursor_j = new_i, new_j
-            elif key == ord('[') or key == ord(',') or key == ord('<'):  # Decrease k layer
-                self.current_k = max(self.k_bounds[0], self.current_k - 1)
-            elif key == ord(']') or key == ord('.') or key == ord('>'):  # Increase k layer
-                self.current_k = min(self.k_bounds[1], self.current_k + 1)
-            elif key == ord('a'):  # Select all
-                for i in range(self.i_bounds[0], self.i_bounds[1] + 1):
-                    for j in range(self.j_bounds[0], self.j_bounds[1] + 1):
-                        for k in range(self.k_bounds[0], self.k_bounds[1] + 1):
-                            self.selected.add((i, j, k))
-            elif key == ord('c') and self.lattice_type != 2:  # Clear all (not hex, 'c' is used for diagonal)
-                self.selected.clear()
-            elif key == ord('r'):  # Reset/clear all (works for both rectangular and hex)
-                self.selected.clear()
+        return False
 
     def _draw_interface(self, stdscr):
-        """Draw the lattice and interface."""
+        """Draw the lattice and interface, repainting only what changed."""
         height, width = stdscr.getmaxyx()
 
-        # Title
-        title = f"VISUAL LATTICE SELECTOR - {'Rectangular' if self.lattice_type == 1 else 'Hexagonal'} Lattice"
-        stdscr.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
-
-        # Instructions (different for hex vs rectangular)
-        if self.lattice_type == 2:  # Hexagonal
-            instructions = [
-                "Arrow Keys: Move (6-dir hex)  |  W/E/Z/X: Diagonals  |  Space/Enter: Toggle",
-                "[/] or ,/. : K-layer  |  a: Select all  |  r: Clear  |  d: Done  |  q/ESC: Cancel"
-            ]
-        else:  # Rectangular
-            instructions = [
-                "Arrow Keys: Move cursor  |  Space/Enter: Toggle  |  [/] or ,/. : K-layer",
-                "a: Select all  |  c: Clear all  |  d: Done  |  q/ESC: Cancel"
-            ]
-        for i, instr in enumerate(instructions):
-            stdscr.addstr(2 + i, 2, instr)
-
-        # Current layer and selection count
-        info = f"K-Layer: {self.current_k}  |  Selected: {len(self.selected)} cells"
+        if not self._static_drawn:
+            # Title
+            title = f"VISUAL LATTICE SELECTOR - {'Rectangular' if self.lattice_type == 1 else 'Hexagonal'} Lattice"
+            stdscr.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
+
+            # Instructions (different for hex vs rectangular)
+            if self.lattice_type == 2:  # Hexagonal
+                instructions = [
+                    "Arrow Keys: Move (6-dir hex)  |  W/E/Z/X: Diagonals  |  Space/Enter: Toggle",
+                    "[/] or ,/. : K-layer  |  a: Select all  |  r: Clear  |  d: Done  |  q/ESC: Cancel"
+                ]
+            else:  # Rectangular
+                instructions = [
+                    "Arrow Keys: Move cursor  |  Space/Enter: Toggle  |  [/] or ,/. : K-layer",
+                    "a: Select all  |  c: Clear all  |  d: Done  |  q/ESC: Cancel"
+                ]
+            for i, instr in enumerate(instructions):
+                stdscr.addstr(2 + i, 2, instr)
+
+        # Current layer and selection count (changes with most keystrokes)
+        info = f"K-Layer: {self.current_k}  |  Selected: {self._selection_count()} cells"
         stdscr.addstr(5, 2, info, curses.A_REVERSE)
+        stdscr.clrtoeol()
 
         # Draw the lattice
         start_row = 7
@@ -944,55 +1286,100 @@ class VisualLatticeSelector:
         else:  # Hexagonal (LAT=2)
             self._draw_hexagonal_lattice(stdscr, start_row, start_col)
 
+        self._static_drawn = True
+
     def _draw_rectangular_lattice(self, stdscr, start_row, start_col):
-        """Draw a rectangular lattice grid."""
+        """Draw a rectangular lattice grid into the pad (diff rendering:
+        only cells whose state changed since the previous frame are
+        written). The visible window is blitted separately by
+        _blit_pad()."""
+        if self._pad is None:
+            self._pad = curses.newpad(self._pad_h, self._pad_w)
+        pad = self._pad
+        self._pad_origin = (start_row, start_col)
+
         try:
-            # Draw column headers (i indices)
-            header = "    " + "".join(f"{i:4d}" for i in range(self.i_bounds[0], self.i_bounds[1] + 1))
-            stdscr.addstr(start_row, start_col, header)
-
-            # Draw top border
-            width = (self.i_bounds[1] - self.i_bounds[0] + 1) * 4 + 1
-            stdscr.addstr(start_row + 1, start_col + 4, "┌" + "─" * (width - 2) + "┐")
-
-            # Draw each row
-            for j in range(self.j_bounds[0], self.j_bounds[1] + 1):
-                row_idx = start_row + 2 + (j - self.j_bounds[0])
-                # Row header (j index)
-                stdscr.addstr(row_idx, start_col, f"{j:3d} ")
-
-                # Draw cells
-                for i in range(self.i_bounds[0], self.i_bounds[1] + 1):
-                    col_idx = start_col + 4 + (i - self.i_bounds[0]) * 4
-
-                    cell = (i, j, self.current_k)
-                    is_cursor = (i == self.cursor_i and j == self.cursor_j)
-                    is_selected = cell in self.selected
-
-                    # Determine what to display
-                    if is_selected and is_cursor:
-                        char = "█"
-                        attr = curses.A_REVERSE | curses.A_BOLD
-                    elif is_selected:
-                        char = "█"
-                        attr = curses.A_BOLD
-                    elif is_cursor:
-                        char = "░"
-                        attr = curses.A_REVERSE
+            if not self._static_drawn:
+                # Column headers (i indices)
+                pad.addstr(0, 0, self._rect_col_header)
+
+                # Borders
+                pad.addstr(1, 4, self._rect_border_top)
+                bottom_row = 2 + (self.j_bounds[1] - self.j_bounds[0] + 1)
+                pad.addstr(bottom_row, 4, self._rect_border_bottom)
+
+                # Row headers (j indices)
+                for row_offset, label in enumerate(self._rect_row_labels):
+                    pad.addstr(2 + row_offset, 0, label)
+
+            # State code -> (char, attr)
+            styles = self._rect_styles
+
+            curr = self._cell_states()
+            diff = np.argwhere(curr != self._prev)
+            if len(diff):
+                # Coalesce adjacent changed cells that share a style into
+                # runs, one addstr per run instead of one per cell. A run
+                # never spans the reverse-video cursor states (there is
+                # only one cursor cell), so the spacer columns written
+                # inside a run are visually blank.
+                order = np.lexsort((diff[:, 0], diff[:, 1]))  # By row, then column
+                runs = []  # [cj, ci_start, length, state]
+                for ci, cj in diff[order].tolist():
+                    state = int(curr[ci, cj])
+                    last = runs[-1] if runs else None
+                    if (last is not None and last[0] == cj and last[3] == state
+                            and ci == last[1] + last[2]):
+                        last[2] += 1
                     else:
-                        char = "·"
-                        attr = curses.A_NORMAL
+                        runs.append([cj, ci, 1, state])
+                for cj, ci_start, length, state in runs:
+                    char, attr = styles[state]
+                    text = " ".join([f" {char} "] * length)
+                    pad.addstr(2 + cj, 4 + ci_start * 4 + 1, text, attr)
+            np.copyto(self._prev, curr)
 
-                    stdscr.addstr(row_idx, col_idx + 1, f" {char} ", attr)
+        except curses.error:
+            # Pad unexpectedly too small
+            stdscr.erase()
+            stdscr.addstr(0, 0, "ERROR: Terminal window too small! Please resize and restart.", curses.A_REVERSE)
+            self._force_repaint()
 
-            # Draw bottom border
-            bottom_row = start_row + 2 + (self.j_bounds[1] - self.j_bounds[0] + 1)
-            stdscr.addstr(bottom_row, start_col + 4, "└" + "─" * (width - 2) + "┘")
+    def _blit_pad(self, stdscr):
+        """Blit the visible window of the lattice pad to the terminal,
+        scrolling as needed to keep the cursor cell in view. Only the
+        window-sized region is transmitted, however large the lattice."""
+        if self._pad is None:
+            return
+        height, width = stdscr.getmaxyx()
+        top, left = self._pad_origin
+        view_h = min(self._pad_h, height - top)
+        view_w = min(self._pad_w, width - left)
+        if view_h <= 0 or view_w <= 0:
+            return
+
+        # Cursor cell in pad coordinates (cells are 4 columns wide)
+        cursor_row = 2 + (self.cursor_j - self.j_bounds[0])
+        cursor_col = 4 + (self.cursor_i - self.i_bounds[0]) * 4
+        vr, vc = self._view
+        # Keep a margin of the header rows / label columns when the cursor
+        # reaches the top or left edge
+        if cursor_row - 2 < vr:
+            vr = cursor_row - 2
+        elif cursor_row > vr + view_h - 1:
+            vr = cursor_row - view_h + 1
+        if cursor_col - 4 < vc:
+            vc = cursor_col - 4
+        elif cursor_col + 3 > vc + view_w - 1:
+            vc = cursor_col + 3 - view_w + 1
+        vr = max(0, min(vr, self._pad_h - view_h))
+        vc = max(0, min(vc, self._pad_w - view_w))
+        self._view = [vr, vc]
 
+        try:
+            self._pad.refresh(vr, vc, top, left, top + view_h - 1, left + view_w - 1)
         except curses.error:
-            # Screen too small
-            stdscr.clear()
-            stdscr.addstr(0, 0, "ERROR: Terminal window too small! Please resize and restart.", curses.A_REVERSE)
+            pass
 
     def _draw_hexagonal_lattice_compact(self, stdscr, start_row, start_col):
         """
@@ -1006,89 +1393,93 @@ class VisualLatticeSelector:
          2  X   X   ·   X   X
         """
         try:
+            height, width = stdscr.getmaxyx()
             i_min, i_max = self.i_bounds
             j_min, j_max = self.j_bounds
+            # Bind the one attribute used per row as a local (LOAD_FAST
+            # instead of a module-attribute lookup in the row loop)
+            dim = curses.A_DIM
 
-            # Draw column header (i indices)
-            # Start with 3 spaces for j-label, then center each i-index in 4-char columns
-            header = "   "  # Space for j-label
-            for i in range(i_min, i_max + 1):
-                header += f" {i:2} "  # Center index in 4-char column
-            stdscr.addstr(start_row, start_col, header, curses.A_DIM)
+            # Column header (i indices), precomputed in __init__
+            stdscr.addstr(start_row, start_col, self._hex_col_header[:max(0, width - start_col - 1)], dim)
             start_row += 1
 
-            # Draw rows
-            for j in range(j_min, j_max + 1):
-                # Build the row string
-                row_str = f"{j:2} "  # j-label (2 chars + space = 3 total)
-
-                # Add offset for odd rows (shift right by 2 spaces to show hex pattern)
-                if j % 2 == 1:
-                    row_str += "  "  # Offset odd rows
-
-                # Draw cells
-                for i in range(i_min, i_max + 1):
-                    at_cursor = (i == self.cursor_i and j == self.cursor_j)
-                    is_selected = (i, j, self.current_k) in self.selected
-
-                    # Choose character
-                    if at_cursor and is_selected:
-                        char = "@"  # Cursor + selected
-                    elif at_cursor:
-                        char = "█"  # Cursor
-                    elif is_selected:
-                        char = "X"  # Selected
-                    else:
-                        char = "·"  # Unselected
+            cur_layer = self._selected_by_k.get(self.current_k, frozenset())
+            # Rows with any selection; rows outside this set (and without
+            # the cursor) are uniform and skip the per-cell state loop
+            sel_rows = {cell[1] for cell in cur_layer}
+            empty_char, empty_style = self._hex_styles[self._ST_EMPTY]
 
-                    # Add to row (1 space + char + 2 spaces = 4 chars per cell)
-                    row_str += f" {char}  "
+            # Clip to the terminal up front: rows below the screen and
+            # cells past the right edge are skipped instead of formatted,
+            # issued, and caught as curses.error per call
+            j_vis_max = min(j_max, j_min + (height - 1 - start_row))
 
-                # Draw the complete row
+            # Draw rows
+            for j in range(j_min, j_vis_max + 1):
                 try:
-                    # Draw non-highlighted parts
                     col = start_col
                     # Draw j-label
-                    stdscr.addstr(start_row, col, f"{j:2} ", curses.A_DIM)
+                    stdscr.addstr(start_row, col, self._hex_row_labels[j - j_min], dim)
                     col += 3
 
                     # Add offset for odd rows
                     if j % 2 == 1:
                         col += 2
 
-                    # Draw each cell with appropriate style
-                    for i in range(i_min, i_max + 1):
+                    # A cell occupies 4 columns starting at col, so
+                    # (width - col) // 4 of them fit fully on screen
+                    i_vis_max = min(i_max, i_min + (width - col) // 4 - 1)
+
+                    # Fast path: a row with no cursor and no selected
+                    # cells is uniform, so emit it as one addstr without
+                    # computing per-cell states
+                    if j != self.cursor_j and j not in sel_rows:
+                        n_vis = i_vis_max - i_min + 1
+                        if n_vis > 0:
+                            stdscr.addstr(start_row, col, f" {empty_char}  " * n_vis, empty_style)
+                        start_row += 1
+                        continue
+
+                    # Draw cells, coalescing same-style neighbors into one
+                    # addstr per run (runs never span the single cursor
+                    # cell, so reverse-video never bleeds into spacers)
+                    run_state = -1
+                    run_col = col
+                    run_len = 0
+                    for i in range(i_min, i_vis_max + 1):
                         at_cursor = (i == self.cursor_i and j == self.cursor_j)
-                        is_selected = (i, j, self.current_k) in self.selected
-
-                        if at_cursor and is_selected:
-                            char = "@"
-                            style = curses.A_REVERSE | curses.A_BOLD
-                        elif at_cursor:
-                            char = "█"
-                            style = curses.A_REVERSE
-                        elif is_selected:
-                            char = "X"
-                            style = curses.A_BOLD
-                        else:
-                            char = "·"
-                            style = curses.A_NORMAL
+                        is_selected = (i, j) in cur_layer
+                        # 2-bit state layout indexes the style table directly
+                        state = 2 * at_cursor + is_selected
 
-                        stdscr.addstr(start_row, col, f" {char}  ", style)
+                        if state == run_state:
+                            run_len += 1
+                        else:
+                            if run_len:
+                                char, style = self._hex_styles[run_state]
+                                stdscr.addstr(start_row, run_col, f" {char}  " * run_len, style)
+                            run_state = state
+                            run_col = col
+                            run_len = 1
                         col += 4
+                    if run_len:
+                        char, style = self._hex_styles[run_state]
+                        stdscr.addstr(start_row, run_col, f" {char}  " * run_len, style)
 
                 except curses.error:
                     pass
 
                 start_row += 1
 
-            # Legend
+            # Legend (only if it fits below the rows)
             legend_row = start_row + 2
-            stdscr.addstr(legend_row, start_col, "Legend: X=Selected  ·=Unselected  █=Cursor  @=Cursor+Selected", curses.A_DIM)
-            stdscr.addstr(legend_row + 1, start_col, "Note: Odd rows (j) shifted right to show hexagonal adjacency", curses.A_DIM)
+            if legend_row + 1 < height:
+                stdscr.addstr(legend_row, start_col, "Legend: X=Selected  ·=Unselected  █=Cursor  @=Cursor+Selected", dim)
+                stdscr.addstr(legend_row + 1, start_col, "Note: Odd rows (j) shifted right to show hexagonal adjacency", dim)
 
         except curses.error:
-            stdscr.clear()
+            stdscr.erase()
             stdscr.addstr(0, 0, "ERROR: Terminal window too small! Please resize and restart.", curses.A_REVERSE)
 
     def _draw_hexagonal_lattice(self, stdscr, start_row, start_col):
@@ -1099,44 +1490,66 @@ class VisualLatticeSelector:
         # Always use compact format for hexagonal lattices
         self._draw_hexagonal_lattice_compact(stdscr, start_row, start_col)
 
-    def _is_selection_contiguous(self) -> bool:
+    def _selection_bounds(self) -> Tuple[int, int, int, int, int, int]:
         """
-        Check if selected cells form a contiguous rectangular range.
-
-        Returns True if the bounding box exactly matches the selected cells.
-        Returns False if there are gaps (non-contiguous selection).
+        Bounding box (i_min, i_max, j_min, j_max, k_min, k_max) of the
+        current selection, computed in a single pass (no intermediate
+        per-axis lists). Selection must be non-empty.
+        """
+        i_min = i_max = j_min = j_max = k_min = k_max = None
+        for k, layer in self._selected_by_k.items():
+            if not layer:
+                continue
+            if k_min is None:
+                k_min = k_max = k
+            else:
+                k_min = min(k_min, k)
+                k_max = max(k_max, k)
+            for i, j in layer:
+                if i_min is None:
+                    i_min = i_max = i
+                    j_min = j_max = j
+                    continue
+                if i < i_min:
+                    i_min = i
+                elif i > i_max:
+                    i_max = i
+                if j < j_min:
+                    j_min = j
+                elif j > j_max:
+                    j_max = j
+        return i_min, i_max, j_min, j_max, k_min, k_max
+
+    def _analyze_selection(self) -> Tuple[bool, Optional[Tuple[int, int, int, int, int, int]]]:
         """
-        if not self.selected:
-            return True  # Empty is trivially contiguous
+        Classify the current selection in one bounds pass.
 
-        if len(self.selected) == 1:
-            return True  # Single element is contiguous
+        Returns (is_contiguous, bounds) where bounds is the
+        (i_min, i_max, j_min, j_max, k_min, k_max) bounding box, or None
+        for an empty selection. The selection is contiguous when the
+        bounding box is exactly filled.
+        """
+        count = self._selection_count()
+        if count == 0:
+            return True, None
 
-        # Calculate bounding box
-        selected_list = list(self.selected)
-        i_vals = [cell[0] for cell in selected_list]
-        j_vals = [cell[1] for cell in selected_list]
-        k_vals = [cell[2] for cell in selected_list]
+        bounds = self._selection_bounds()
+        i_min, i_max, j_min, j_max, k_min, k_max = bounds
+        expected_count = (i_max - i_min + 1) * (j_max - j_min + 1) * (k_max - k_min + 1)
 
-        i_min, i_max = min(i_vals), max(i_vals)
-        j_min, j_max = min(j_vals), max(j_vals)
-        k_min, k_max = min(k_vals), max(k_vals)
+        # All selected cells lie inside the bounding box by construction,
+        # so a distinct-point count equal to the box volume means the box
+        # is exactly filled; no per-cell verification loop is needed
+        return expected_count == count, bounds
 
-        # Calculate expected size of bounding box
-        expected_count = (i_max - i_min + 1) * (j_max - j_min + 1) * (k_max - k_min + 1)
-        actual_count = len(self.selected)
-
-        # Check if all cells in bounding box are selected
-        if expected_count == actual_count:
-            # Double-check: verify every cell in range is selected
-            for i in range(i_min, i_max + 1):
-                for j in range(j_min, j_max + 1):
-                    for k in range(k_min, k_max + 1):
-                        if (i, j, k) not in self.selected:
-                            return False
-            return True
+    def _is_selection_contiguous(self) -> bool:
+        """
+        Check if selected cells form a contiguous rectangular range.
 
-        return False
+        Returns True if the bounding box exactly matches the selected cells.
+        Returns False if there are gaps (non-contiguous selection).
+        """
+        return self._analyze_selection()[0]
 
     def _create_lattice_spec(self) -> LatticeSpec:
         """
@@ -1145,22 +1558,16 @@ class VisualLatticeSelector:
         - If selection is contiguous: creates range-based spec
         - If selection is non-contiguous: creates element-list spec
         """
-        if not self.selected:
+        # One pass yields both the contiguity verdict and the bounds it
+        # was computed from, so the contiguous branch reuses them instead
+        # of rescanning the selection
+        is_contiguous, bounds = self._analyze_selection()
+        if bounds is None:
             return None
 
-        # Check if selection is contiguous
-        is_contiguous = self._is_selection_contiguous()
-
         if is_contiguous:
             # CONTIGUOUS: Use range-based spec (original behavior)
-            selected_list = list(self.selected)
-            i_vals = [cell[0] for cell in selected_list]
-            j_vals = [cell[1] for cell in selected_list]
-            k_vals = [cell[2] for cell in selected_list]
-
-            i_min, i_max = min(i_vals), max(i_vals)
-            j_min, j_max = min(j_vals), max(j_vals)
-            k_min, k_max = min(k_vals), max(k_vals)
+            i_min, i_max, j_min, j_max, k_min, k_max = bounds
 
             # Create spec (use range if multiple values, otherwise single)
             def make_spec_dim(min_val, max_val):
@@ -1177,7 +1584,7 @@ class VisualLatticeSelector:
         else:
             # NON-CONTIGUOUS: Use element-list spec
             # Sort elements for consistent output
-            elements_list = sorted(list(self.selected))
+            elements_list = sorted(self.selected)
 
             return LatticeSpec(
                 elements=elements_list
@@ -1186,6 +1593,11 @@ class VisualLatticeSelector:
 
 def main():
     """Main entry point."""
+    # Block-buffer stdout; the wizard batches its writes and flushes
+    # before each prompt (input() flushes stdout itself)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     wizard = MCNPWizard()
     try:
         wizard.run()
@@ -1193,7 +1605,6 @@ def main():
         print("\n\nWizard cancelled by user.")
     except Exception as e:
         print(f"\n\nError: {e}")
-        import traceback
         traceback.print_exc()
     
     print("\n" + "=" * 70)